@@ -88,7 +88,7 @@ GOTO %1
 
 :: Run all tests in module
 :test
-	CALL conda run -p %CONDA_DIR% pytest "%~dp0testing"
+	CALL conda run -p %CONDA_DIR% pytest -n auto "%~dp0testing"
 	GOTO end
 
 :: black formatting
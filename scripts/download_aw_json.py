@@ -1,12 +1,17 @@
 # coding: utf-8
 
+import asyncio
 import datetime
+from itertools import filterfalse
 import json
 import logging
+import os
 from pathlib import Path
-import re
+import random
 
-from reach_tools.utils.procure import download_raw_json_from_aw
+import aiofiles
+import aiohttp
+import orjson
 
 # file name without extension
 file_name = Path(__file__).stem
@@ -43,47 +48,203 @@ fail_count = 0
 max_fail = 5000
 max_range = 10000000
 
-# get a list of reaches already downloaded
-existing_reach_id_lst = [int(re.search(r"aw_(\d+)\.json", pth.name).group(1)) for pth in dir_raw_aw.glob('aw_*.json')]
+# how many fetch and write workers to run - fetch worker count bounds in-flight requests
+num_fetch_workers = 256
+num_write_workers = 8
 
-if len(existing_reach_id_lst):
-    logger.info(f"{len(existing_reach_id_lst):,} reaches have already been downloaded to {dir_raw_aw}.")
+# bound on queued work so slow stages apply backpressure instead of ballooning memory
+queue_size = 1024
 
-    # sort the reaches sequentially
-    existing_reach_id_lst.sort()
+# how many times to try a single reach before counting it as failed
+max_attempts = 3
 
-    # start at the last retrieved reach id
-    start_id = existing_reach_id_lst[-1]
+# cap on how long any single request can take
+request_timeout = aiohttp.ClientTimeout(total=30)
 
-for reach_id in range(start_id, max_range):
+# flipped when too many ids fail in a row, telling pending tasks to stop
+abort_event = asyncio.Event()
 
-    # location for saving the reach json
-    file_pth = dir_raw_aw / f'aw_{reach_id:08d}.json'
+# url template for retrieving reach data
+url_template = 'https://www.americanwhitewater.org/content/River/detail/id/{reach_id}/.json'
 
-    # handle if file already exists
-    if reach_id in existing_reach_id_lst:
-        logger.debug(f"reach_id={reach_id} already exists at {file_pth}")
+# header dictionary with user agent for cloudflare
+headers = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/135.0.1.0.dev0 Safari/537.36 "
+    "Edg/135.0.1.0.dev0"
+}
+
+# manifest recording the reach id of every successfully downloaded file
+manifest_pth = dir_raw_aw / 'downloaded_ids.txt'
+
+# load already downloaded reach ids from the manifest, only falling back to scanning the directory if it is missing
+if manifest_pth.exists():
+    existing_reach_ids = {int(val) for val in manifest_pth.read_text().split()}
+else:
+    # every glob match is aw_<zero padded id>.json, so slice the id straight out of the stem
+    existing_reach_ids = {int(pth.stem[3:]) for pth in dir_raw_aw.glob('aw_*.json')}
+
+    # save the manifest so subsequent runs do not have to scan the directory - one id per line
+    # with a trailing newline so later appends always start on a fresh line
+    manifest_pth.write_text(''.join(f'{reach_id}\n' for reach_id in sorted(existing_reach_ids)))
+
+if len(existing_reach_ids):
+    logger.info(f"{len(existing_reach_ids):,} reaches have already been downloaded to {dir_raw_aw}.")
+
+# manifest handle for appending successful downloads
+manifest_file = open(manifest_pth, 'a')
+
+# ids buffered in memory so the manifest is written and synced in batches rather than per reach
+manifest_buffer = []
+manifest_batch_size = 64
+
+
+def flush_manifest(force: bool = False) -> None:
+    """Write buffered reach ids to the manifest, one write and fsync per batch instead of per reach."""
+    if len(manifest_buffer) and (force or len(manifest_buffer) >= manifest_batch_size):
+        manifest_file.write(''.join(f'{reach_id}\n' for reach_id in manifest_buffer))
+        manifest_file.flush()
+        os.fsync(manifest_file.fileno())
+        manifest_buffer.clear()
+
+
+async def produce_ids(id_queue: asyncio.Queue) -> None:
+    """Feed reach ids needing download into the id queue, applying backpressure through the bounded queue."""
+    for reach_id in filterfalse(existing_reach_ids.__contains__, range(start_id, max_range)):
+
+        # stop feeding work once the run has been aborted
+        if abort_event.is_set():
+            break
+
+        await id_queue.put(reach_id)
+
+
+async def fetch_worker(session: aiohttp.ClientSession, id_queue: asyncio.Queue, write_queue: asyncio.Queue) -> None:
+    """Pull reach ids off the id queue, download the raw JSON, and hand payloads to the write workers."""
+    global fail_count
+
+    while True:
+
+        reach_id = await id_queue.get()
+
+        try:
+            # drain remaining ids without fetching if the run has been aborted
+            if abort_event.is_set():
+                continue
+
+            # gate the debug message so the f-string is not formatted when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Attempting to download reach_id={reach_id}")
+
+            for attempt in range(max_attempts):
+
+                try:
+                    # make the request to the url, reusing a pooled keep-alive connection from the session
+                    async with session.get(url_template.format(reach_id=reach_id)) as resp:
+
+                        # check the status code of the response
+                        if resp.status != 200:
+                            raise aiohttp.ClientResponseError(
+                                resp.request_info, resp.history, status=resp.status
+                            )
+
+                        # read the payload from the response
+                        aw_json = await resp.json()
+
+                    # hand off to a write worker so encoding and disk do not block the next fetch
+                    await write_queue.put((reach_id, aw_json))
+
+                    # reset fail count
+                    fail_count = 0
+
+                    break
+
+                except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError):
+                    # back off with jitter before trying again rather than hammering the rate limiter
+                    if attempt + 1 < max_attempts:
+                        await asyncio.sleep(2 ** attempt + random.random())
+
+            else:
+                # all attempts exhausted for this reach id - lazy percent formatting so disabled
+                # debug logging costs nothing
+                logger.debug('Could not retrieve data for reach_id=%d (fail_count: %d)', reach_id, fail_count)
+                fail_count += 1
+
+                # stop the run once enough ids fail in a row - the remaining range is almost certainly empty
+                if fail_count >= max_fail and not abort_event.is_set():
+                    logger.error(f'Aborting run after {fail_count:,} consecutive failed reach ids.')
+                    abort_event.set()
+
+        finally:
+            id_queue.task_done()
+
+
+async def write_worker(write_queue: asyncio.Queue) -> None:
+    """Encode downloaded payloads and save them to disk, overlapping with in-flight fetches."""
+    while True:
+
+        reach_id, aw_json = await write_queue.get()
 
-    else:        
-        logger.debug(f"Attempting to download reach_id={reach_id}")
-        
         try:
-            # download the data from AW
-            aw_json = download_raw_json_from_aw(reach_id)
-    
+            # location for saving the reach json
+            file_pth = dir_raw_aw / f'aw_{reach_id:08d}.json'
+
             # if the file exists, clean it out
             if file_pth.exists():
                 file_pth.unlink()
-    
-            # save to a local file
-            with open(file_pth, 'x') as fp:
-                json.dump(aw_json, fp, indent=2)
-    
+
+            # save to a local file without blocking the event loop, compact and serialized in C rather than
+            # pretty-printed by the stdlib encoder
+            async with aiofiles.open(file_pth, 'xb') as fp:
+                await fp.write(orjson.dumps(aw_json))
+
+            # record the reach id in the manifest so it is skipped on subsequent runs
+            manifest_buffer.append(reach_id)
+            flush_manifest()
+
             logger.info(f'Downloaded reach_id={reach_id} and saved to {file_pth}')
 
-            # reset fail count
-            fail_count = 0
-    
-        except:
-            logger.debug(f'Could not retrieve data for reach_id={reach_id} (fail_count: {fail_count})')
-            fail_count += 1
+        except OSError:
+            logger.debug('Could not save data for reach_id=%d', reach_id, exc_info=True)
+
+        finally:
+            write_queue.task_done()
+
+
+async def main() -> None:
+    """Concurrently download all reaches not already saved locally."""
+    # bounded queues connecting the producer, fetch, and write stages
+    id_queue = asyncio.Queue(queue_size)
+    write_queue = asyncio.Queue(queue_size)
+
+    # connector with a pool of keep-alive connections shared by all requests
+    connector = aiohttp.TCPConnector(limit=num_fetch_workers, limit_per_host=64, ttl_dns_cache=600)
+
+    # one session shared across all requests so connections are reused
+    async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=request_timeout) as session:
+
+        # start the fetch and write worker pools
+        workers = [
+            asyncio.create_task(fetch_worker(session, id_queue, write_queue))
+            for _ in range(num_fetch_workers)
+        ]
+        workers.extend(
+            asyncio.create_task(write_worker(write_queue)) for _ in range(num_write_workers)
+        )
+
+        # feed all the ids through, then wait for both stages to drain
+        await produce_ids(id_queue)
+        await id_queue.join()
+        await write_queue.join()
+
+        # workers loop forever, so shut them down once the queues are drained
+        for worker in workers:
+            worker.cancel()
+
+    # make sure any partial batch of ids is durably recorded
+    flush_manifest(force=True)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
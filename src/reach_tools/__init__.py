@@ -4,12 +4,12 @@ __author__ = "Joel McCune (https://github.com/knu2xs)"
 __license__ = "Apache 2.0"
 __copyright__ = "Copyright 2023 by Joel McCune (https://github.com/knu2xs)"
 
-__all__ = ["Reach", "ReachPoint", "utils"]
+__all__ = ["Reach", "ReachPoint", "reaches_to_dataframe", "utils"]
 
 import json
 from datetime import datetime
 from functools import cached_property
-from hashlib import md5
+from hashlib import blake2b
 from pathlib import Path
 from typing import Union
 
@@ -18,17 +18,92 @@ from arcgis.features import Feature
 from arcgis.geometry import Geometry, Polygon, Polyline, Point
 import pandas as pd
 
+# orjson decodes the large AW payloads several times faster than the stdlib json module, but is
+# optional - fall back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import utils
 from .utils import strip_html_tags, cleanup_string
 from .utils.reference import lookup_dict
 from .utils.procure import download_raw_json_from_aw
 
+# declarative flag tables mapping the AW "is" properties to point type and subtype - scanned in
+# priority order so hydration does not walk a branch ladder per point
+_TYPE_FLAGS = (
+    ("isputin", ("access", "putin")),
+    ("istakeout", ("access", "takeout")),
+    ("access", ("access", "intermediate")),
+    ("israpid", ("rapid", None)),
+    ("ishazard", ("hazard", None)),
+)
+_SUBTYPE_FLAGS = (
+    ("isportage", "portage"),
+    ("iswaterfall", "waterfall"),
+    ("isplayspot", "playspot"),
+)
+
+# non-geometry properties collected into Reach.attributes - hoisted to module scope so the key
+# list is built once rather than per access
+_REACH_ATTR_KEYS = (
+    "abstract",
+    "description",
+    "difficulty",
+    "difficulty_filter",
+    "difficulty_maximum",
+    "difficulty_minimum",
+    "difficulty_outlier",
+    "gauge_id",
+    "gauge_max",
+    "gauge_metric",
+    "gauge_min",
+    "gauge_observation",
+    "gauge_source",
+    "gauge_stage",
+    "length",
+    "name",
+    "notes",
+    "reach_id",
+    "river_name",
+    "runnable",
+    "section_name",
+    "source",
+    "uid",
+    "url",
+)
+
 
 class ReachPoint(object):
     """
     Discrete object facilitating working with reach points.
     """
 
+    # slots pack attributes into fixed offsets, dropping the per-instance dict for potentially many points
+    __slots__ = (
+        "reach_id",
+        "point_type",
+        "subtype",
+        "name",
+        "update_date",
+        "description",
+        "difficulty",
+        "_side_of_river",
+        "_geometry",
+    )
+
+    # fields published when emitting features, dictionaries and DataFrames
+    _PUBLIC = (
+        "reach_id",
+        "point_type",
+        "subtype",
+        "name",
+        "update_date",
+        "description",
+        "difficulty",
+    )
+
     def __init__(
         self,
         reach_id,
@@ -64,40 +139,22 @@ class ReachPoint(object):
         """Create a Reach Point from point (rapids) JSON."""
         # check for a couple of keys to ensure have the right object
         if not isinstance(aw_json, dict) or (
-            "name" not in aw_json.keys() and "reach_id" not in aw_json.keys()
+            "name" not in aw_json and "reach_id" not in aw_json
         ):
             raise ValueError(
                 "Please provide a single JSON point JSON (rapids list item)."
             )
 
-        # initialize subtype
-        subtyp = None
-
-        # determine the type and subtype based on the "is" properties
-        if aw_json.get("isputin") == 1:
-            typ, subtyp = "access", "putin"
-        elif aw_json.get("istakeout") == 1:
-            typ, subtyp = "access", "takeout"
-        elif aw_json.get("access") == 1:
-            typ, subtyp = "access", "intermediate"
-        elif aw_json.get("israpid") == 1:
-            typ = "rapid"
-        elif aw_json.get("ishazard") == 1:
-            typ = "hazard"
-        else:
-            typ = "generic"
-
-        if aw_json.get("isportage") == 1:
-            subtyp = "portage"
-        elif aw_json.get("iswaterfall") == 1:
-            subtyp = "waterfall"
-        elif aw_json.get("isplayspot") == 1:
-            subtyp = "playspot"
-
-        # build the geometry
-        geom = (
-            Geometry(aw_json.get("rloc")) if aw_json.get("rloc") is not None else None
+        # determine the type and subtype from the "is" properties using the flag tables
+        typ, subtyp = next(
+            (val for key, val in _TYPE_FLAGS if aw_json.get(key) == 1), ("generic", None)
         )
+        subtyp = next(
+            (val for key, val in _SUBTYPE_FLAGS if aw_json.get(key) == 1), subtyp
+        )
+
+        # keep the raw location dict - the geometry property materializes it on first access
+        geom = aw_json.get("rloc")
 
         # get the update date, as a datetime
         update_dt = (
@@ -121,30 +178,32 @@ class ReachPoint(object):
 
         return pt
 
-    @cached_property
+    @property
     def wkt(self) -> str:
         """Access point geometry in WKT format."""
         return self.geometry.WKT
 
-    @cached_property
+    @property
     def ewkt(self) -> str:
         """Access point geometry in EWKT format."""
         return self.geometry.EWKT
 
-    @cached_property
+    @property
     def wkb(self) -> bytes:
         """Access point geometry in WKB format."""
         return self.geometry.WKB
 
-    @cached_property
+    @property
     def geojson(self) -> dict:
         """Access point geometry in GeoJSON format."""
         return self.geometry.__geo_interface__
 
     @property
     def geometry(self):
-        geom = self._geometry
-        return geom
+        # if holding a raw location dict from source json, only build the Geometry object when accessed
+        if isinstance(self._geometry, dict) and not isinstance(self._geometry, Geometry):
+            self._geometry = Geometry(self._geometry)
+        return self._geometry
 
     @geometry.setter
     def geometry(self, geometry):
@@ -174,7 +233,7 @@ class ReachPoint(object):
         else:
             self._side_of_river = side_of_river
 
-    @cached_property
+    @property
     def feature(self):
         """
         Get the access as an ArcGIS Python API Feature object.
@@ -182,22 +241,16 @@ class ReachPoint(object):
         """
         return Feature(
             geometry=self.geometry,
-            attributes={
-                key: vars(self)[key]
-                for key in vars(self).keys()
-                if key != "_geometry" and not key.startswith("_")
-            },
+            attributes={key: getattr(self, key) for key in self._PUBLIC},
         )
 
-    @cached_property
+    @property
     def dictionary(self):
         """
         Get the point as a dictionary of values making it easier to build DataFrames.
         :return: Dictionary of all properties, with a little modification for geometries.
         """
-        dict_point = {
-            key: vars(self)[key] for key in vars(self).keys() if not key.startswith("_")
-        }
+        dict_point = {key: getattr(self, key) for key in self._PUBLIC}
         dict_point["SHAPE"] = self.geometry
         return dict_point
 
@@ -216,6 +269,9 @@ class Reach(object):
         self.validated_by: str = None
         self._geometry: Polyline = None
         self._reach_points: list[ReachPoint] = []
+        self._point_index: dict[tuple[str, str], list[ReachPoint]] = {}
+        self._putin: ReachPoint = None
+        self._takeout: ReachPoint = None
         self.agency: str = None
         self._gauge_observation: Union[int, float] = None
         self._difficulty_minimum: str = None
@@ -234,36 +290,39 @@ class Reach(object):
     @property
     def _raw_json(self) -> dict:
         """Access saved raw JSON"""
-        return self._raw_json
+        return self.__raw_json
 
     @_raw_json.setter
     def _raw_json(self, raw_json: dict) -> None:
         """When setting raw JSON, make different blocks easily accessible."""
+        self.__raw_json = raw_json
+
         if raw_json is not None:
+            # bore into the view container once, falling back to the input if the payload is not wrapped
+            view_json = raw_json.get("CContainerViewJSON_view", raw_json)
+
             # hydrate main json
-            if "CContainerViewJSON_view" in raw_json.keys():
-                self._main_json = raw_json["CContainerViewJSON_view"].get(
-                    "CRiverMainGadgetJSON_main"
-                )
-            elif "CRiverMainGadgetJSON_main" in raw_json.keys():
-                self._main_json = raw_json.get("CRiverMainGadgetJSON_main")
-            else:
-                self._main_json = raw_json
+            self._main_json = view_json.get("CRiverMainGadgetJSON_main", view_json)
 
             # hydrate rapids list
-            if "CContainerViewJSON_view" in raw_json.keys():
-                rapids_dict = raw_json["CContainerViewJSON_view"].get(
-                    "CRiverRapidsGadgetJSON_view-rapids"
-                )
-            elif "CRiverMainGadgetJSON_rapids" in raw_json.keys():
-                rapids_dict = raw_json.get("CRiverRapidsGadgetJSON_view-rapids")
-            else:
-                rapids_dict = raw_json
+            rapids_dict = view_json.get("CRiverRapidsGadgetJSON_view-rapids", view_json)
 
-            if "rapids" in rapids_dict.keys():
+            if "rapids" in rapids_dict:
                 self._rapids_json = rapids_dict.get("rapids")
 
     @cached_property
+    def _info(self) -> dict:
+        """Info block from the main AW JSON, fetched once and shared by the dependent properties."""
+        return self._main_json.get("info") or {}
+
+    @cached_property
+    def _first_gauge(self) -> dict:
+        """First gauge dict from the main AW JSON, fetched once and shared by the dependent
+        properties, or None when the reach has no gauge."""
+        gauges = self._main_json.get("gauges")
+        return gauges[0] if gauges else None
+
+    @property
     def difficulty_filter(self) -> float:
         val = lookup_dict.get(self.difficulty_maximum)
         return val
@@ -279,6 +338,16 @@ class Reach(object):
                 ReachPoint.from_aw_json(pt_json) for pt_json in self._rapids_json
             ]
 
+            # index points by type and subtype, and save the putin and takeout on dedicated
+            # attributes, so access is O(1) rather than a scan
+            for pt in self._reach_points:
+                self._point_index.setdefault((pt.point_type, pt.subtype), []).append(pt)
+                if pt.point_type == "access":
+                    if pt.subtype == "putin" and self._putin is None:
+                        self._putin = pt
+                    elif pt.subtype == "takeout" and self._takeout is None:
+                        self._takeout = pt
+
         return self._reach_points
 
     @cached_property
@@ -287,7 +356,14 @@ class Reach(object):
         Get all the reach points as a list of features.
         :return: List of ArcGIS Python API Feature objects.
         """
-        return [pt.to_feature for pt in self._reach_points]
+        return [pt.feature for pt in self.reach_points]
+
+    def iter_reach_points_features(self):
+        """
+        Iterate the reach points as features without materializing the full list.
+        :return: Generator of ArcGIS Python API Feature objects.
+        """
+        return (pt.feature for pt in self.reach_points)
 
     @cached_property
     def reach_points_dataframe(self):
@@ -295,7 +371,14 @@ class Reach(object):
         Get the reach points as an Esri Spatially Enabled Pandas DataFrame.
         :return:
         """
-        df_pt = pd.DataFrame([pt.to_dictionary for pt in self._reach_points])
+        # hydrate the points once
+        pts = self.reach_points
+
+        # build columns directly so pandas does not infer dtypes from a list of row dicts
+        cols = {key: [getattr(pt, key) for pt in pts] for key in ReachPoint._PUBLIC}
+        cols["SHAPE"] = [pt.geometry for pt in pts]
+
+        df_pt = pd.DataFrame(cols)
         df_pt.spatial.set_geometry("SHAPE")
         return df_pt
 
@@ -307,15 +390,17 @@ class Reach(object):
         :return: Point Geometry
             Centroid representing the reach location as a point.
         """
-        # if the hydroline is defined, use the centroid of the hydroline extent
+        # if the hydroline is defined, use the centroid of the hydroline extent - prefer the
+        # bbox already cached from the source JSON over an O(n) vertex scan of the polyline
         if isinstance(self.geometry, Polyline):
 
-            xmin, ymin, xmax, ymax = self.geometry.extent
+            bbox = self.extent if self.extent is not None else self.geometry.extent
+            xmin, ymin, xmax, ymax = bbox
 
             cntr = Geometry(
                 {
-                    "x": (xmax - xmin) / 2 + xmin,
-                    "y": (ymax - ymin) / 2 + ymin,
+                    "x": 0.5 * (xmin + xmax),
+                    "y": 0.5 * (ymin + ymax),
                     "spatialReference": self.geometry.spatial_reference,
                 }
             )
@@ -325,11 +410,12 @@ class Reach(object):
             self.takeout, ReachPoint
         ):
 
-            # create a point geometry using the average coordinates
+            # create a point geometry using the average coordinates - plain scalar arithmetic, since
+            # np.mean on a two-element list pays ufunc dispatch overhead for no benefit
             cntr = Geometry(
                 {
-                    "x": np.mean([self.putin.geometry.x, self.takeout.geometry.x]),
-                    "y": np.mean([self.putin.geometry.y, self.takeout.geometry.y]),
+                    "x": (self.putin.geometry.x + self.takeout.geometry.x) * 0.5,
+                    "y": (self.putin.geometry.y + self.takeout.geometry.y) * 0.5,
                     "spatialReference": self.putin.geometry.spatial_reference,
                 }
             )
@@ -350,7 +436,7 @@ class Reach(object):
     @cached_property
     def extent(self) -> tuple[float, float, float, float]:
         """Provide the extent of the reach as (xmin, ymin, xmax, ymax)"""
-        val = self._main_json.get("info").get("bbox")
+        val = self._info.get("bbox")
         return val
 
     @cached_property
@@ -393,54 +479,28 @@ class Reach(object):
             return f"{self.river_name} - {self.reach_name}"
 
     @cached_property
-    def gauge_min(self) -> float:
-        """Minimum runnable gauge value."""
+    def _gauge_values(self) -> np.ndarray:
+        """Runnable gauge metric values from the AW JSON dict as a contiguous float array."""
         # get the values from the AW JSON dict
-        res = list(
-            zip(
-                *(
-                    utils.aw.get_gauge_value_list(
-                        self._main_json.get("guagesummary").get("ranges")
-                    )
-                )
+        val_lst = [
+            val
+            for _, val in utils.aw.get_gauge_value_list(
+                self._main_json.get("guagesummary").get("ranges")
             )
-        )
-
-        # ensure there are values to with
-        if len(res) != 2:
-            min_val = None
-
-        # get the minimum value, if values exist
-        else:
-            val_lst = res[1]
-            min_val = min(val_lst) if len(val_lst) > 0 else None
+        ]
+        return np.asarray(val_lst, dtype=np.float64)
 
-        return min_val
+    @property
+    def gauge_min(self) -> float:
+        """Minimum runnable gauge value."""
+        vals = self._gauge_values
+        return float(vals.min()) if vals.size else None
 
-    @cached_property
+    @property
     def gauge_max(self) -> float:
         """Maximum runnable gauge value."""
-        # get the values from the AW JSON dict
-        res = list(
-            zip(
-                *(
-                    utils.aw.get_gauge_value_list(
-                        self._main_json.get("guagesummary").get("ranges")
-                    )
-                )
-            )
-        )
-
-        # ensure there are values to with
-        if len(res) != 2:
-            max_val = None
-
-        # get the minimum value, if values exist
-        else:
-            val_lst = res[1]
-            max_val = max(val_lst) if len(val_lst) > 0 else None
-
-        return max_val
+        vals = self._gauge_values
+        return float(vals.max()) if vals.size else None
 
     @property
     def runnable(self) -> bool:
@@ -462,18 +522,18 @@ class Reach(object):
     @cached_property
     def river_name(self):
         """Name of the River."""
-        val = utils.aw.get_key_from_block(self._main_json.get("info"), "river")
+        val = utils.aw.get_key_from_block(self._info, "river")
         val = utils.remove_backslashes(val)
         return val
 
     @cached_property
     def reach_name(self):
         """Name of the reach (section)."""
-        val = utils.aw.get_key_from_block(self._main_json.get("info"), "section")
+        val = utils.aw.get_key_from_block(self._info, "section")
         val = utils.remove_backslashes(val)
         return val
 
-    @cached_property
+    @property
     def section_name(self):
         """Name of section (reach)."""
         return self.reach_name
@@ -488,29 +548,30 @@ class Reach(object):
     @cached_property
     def description(self):
         """Description of the reach."""
-        val = utils.aw.get_key_from_block(self._main_json.get("info"), "description_md")
+        val = utils.aw.get_key_from_block(self._info, "description_md")
         return val
 
     @cached_property
     def abstract(self):
         """Abstract (short description) of the reach."""
-        val = utils.aw.get_key_from_block(self._main_json.get("info"), "abstract_md")
+        val = utils.aw.get_key_from_block(self._info, "abstract_md")
 
         # if there is not an abstract, create one from the description
         if (val is None or len(val) == 0) and (
             self.description is not None and len(self.description) > 0
         ):
 
-            # remove all line returns, html tags, trim to 500 characters, and trim to last space to ensure full word
-            val = self.description.replace("\\", "").replace("/n", "")[:500]
-            val = val[: val.rfind(" ")]
-            val = val + "..."
+            # remove artifacts, then trim to the last full word inside 500 characters using a
+            # bounded rfind so no intermediate 500 character slice is allocated
+            val = self.description.replace("\\", "").replace("/n", "")
+            cut = val.rfind(" ", 0, 500)
+            val = val[: cut if cut >= 0 else min(len(val), 500) - 1] + "..."
 
         return val
 
     @cached_property
     def length(self) -> float:
-        val = utils.aw.get_key_from_block(self._main_json.get("info"), "length")
+        val = utils.aw.get_key_from_block(self._info, "length")
 
         # make sure returning a float
         if isinstance(val, int) or (isinstance(val, str) and val.isnumeric()):
@@ -518,25 +579,17 @@ class Reach(object):
 
         return val
 
-    @cached_property
+    @property
     def has_gauge(self) -> bool:
         """Boolean indicating if gauge information is available."""
-        if (
-            self._main_json.get("gauges") is not None
-            and len(self._main_json.get("gauges")) > 0
-        ):
-            val = True
-        else:
-            val = False
-
-        return val
+        return self._first_gauge is not None
 
     @property
     def gauge_observation(self) -> float:
         """Gage observation (stage)."""
         # if nothing already saved and data is available, set it
         if self._gauge_observation is None and self.has_gauge:
-            obs = self._main_json.get("gauges")[0].get("gauge_reading")
+            obs = self._first_gauge.get("gauge_reading")
             if (isinstance(obs, str) and obs.isnumeric()) or isinstance(obs, int):
                 self._gauge_observation = float(obs)
 
@@ -552,67 +605,65 @@ class Reach(object):
 
             self.gauge_observation = val
 
-    @cached_property
+    @property
     def gauge_id(self) -> str:
         if self.has_gauge and self._gauge_id is None:
-            self._gauge_id = str(self._main_json.get("gauges")[0].get("gauge_id"))
+            self._gauge_id = str(self._first_gauge.get("gauge_id"))
         return self._gauge_id
 
-    @cached_property
+    @property
     def gauge_source(self) -> str:
         """Source for the gauge."""
         if self.has_gauge:
-            val = self._main_json.get("gauges")[0].get("source")
+            val = self._first_gauge.get("source")
         else:
             val = None
         return val
 
-    @cached_property
+    @property
     def gauge_metric(self) -> str:
         """Gauge metric, typically feet, inches, meters, cfs (cubic feet per second) or cms (cubic meters per second)."""
         if self.has_gauge and self._gauge_metric is None:
-            self._gauge_metric = self._main_json.get("gauges")[0].get("metric_unit")
+            self._gauge_metric = self._first_gauge.get("metric_unit")
 
         return self._gauge_metric
 
     @cached_property
     def edited_timestamp(self) -> datetime:
         """Date last modified."""
-        val = self._main_json.get("info").get("edited")
-        val = datetime.strptime(val, "%Y-%m-%d %H:%M:%S")
+        # fromisoformat is a C-level parse and handles the space-separated AW format directly,
+        # where strptime interprets the format string on every call
+        val = self._info.get("edited")
+        val = datetime.fromisoformat(val)
         return val
 
-    @cached_property
+    @property
     def difficulty(self) -> str:
         """Reach difficulty."""
-        val = self._main_json.get("info").get("class")
+        val = self._info.get("class")
         return val
 
-    def _lookup_difficulty(self):
-        """Helper to assign difficulty parts from single difficultly string."""
-
-        (
-            self._difficulty_minimum,
-            self._difficulty_maximum,
-            self._difficulty_outlier,
-        ) = utils.get_difficulty_parts(self.difficulty)
+    @cached_property
+    def _difficulty_parts(self) -> tuple[str, str, str]:
+        """Difficulty parts parsed from the single difficulty string, parsed once per reach."""
+        return utils.get_difficulty_parts(self.difficulty)
 
     @property
     def difficulty_minimum(self) -> str:
         if self._difficulty_minimum is None:
-            self._lookup_difficulty()
+            return self._difficulty_parts[0]
         return self._difficulty_minimum
 
     @property
     def difficulty_maximum(self) -> str:
         if self._difficulty_maximum is None:
-            self._lookup_difficulty()
+            return self._difficulty_parts[1]
         return self._difficulty_maximum
 
     @property
     def difficulty_outlier(self) -> str:
         if self._difficulty_outlier is None:
-            self._lookup_difficulty()
+            return self._difficulty_parts[2]
         return self._difficulty_outlier
 
     @difficulty_minimum.setter
@@ -632,11 +683,11 @@ class Reach(object):
 
     @cached_property
     def update_timestamp(self):
-        val = self._main_json.get("info").get("updated_at")
+        val = self._info.get("updated_at")
         val_dt = datetime.fromisoformat(val)
         return val_dt
 
-    @cached_property
+    @property
     def url(self) -> str:
         """Web URL of the reach."""
         val = f"https://www.americanwhitewater.org/content/River/view/river-detail/{self.reach_id}/main"
@@ -663,6 +714,17 @@ class Reach(object):
 
         return reach
 
+    @classmethod
+    def from_aw_json_bytes(cls, data: bytes) -> "Reach":
+        """
+        Create a reach from a raw AW JSON payload that is still bytes, decoding it exactly once.
+
+        Args:
+            data: Raw AW JSON response body.
+        """
+        raw_aw_json = orjson.loads(data) if orjson is not None else json.loads(data)
+        return cls.from_aw_json(raw_aw_json)
+
     @classmethod
     def from_aw_json(cls, raw_aw_json: Union[dict, Path]) -> "Reach":
         """
@@ -671,21 +733,19 @@ class Reach(object):
         Args:
             raw_aw_json: Raw AW JSON string representation of reach data.
         """
-        # if provided a path to JSON
+        # if provided a path to JSON, parse straight from bytes so no intermediate str is built
         if isinstance(raw_aw_json, Path):
-            with open(raw_aw_json, "r") as f:
-                raw_aw_json = json.load(f)
-
-        # extract the reach_id from the JSON
-        reach_id = (
-            raw_aw_json.get("CContainerViewJSON_view")
-            .get("CRiverMainGadgetJSON_main")
-            .get("info")
-            .get("id")
-        )
+            if orjson is not None:
+                raw_aw_json = orjson.loads(raw_aw_json.read_bytes())
+            else:
+                with open(raw_aw_json, "r") as f:
+                    raw_aw_json = json.load(f)
+
+        # bore down to the main block once and extract the reach_id from the JSON
+        main_json = raw_aw_json["CContainerViewJSON_view"]["CRiverMainGadgetJSON_main"]
 
         # create instance of reach
-        reach = cls(reach_id)
+        reach = cls(main_json["info"]["id"])
 
         # load the JSON into the reach
         reach._raw_json = raw_aw_json
@@ -707,14 +767,10 @@ class Reach(object):
                 'access type must be either "putin", "takeout" or "intermediate"'
             )
 
-        # return list of all accesses of specified type
-        pt_lst = [
-            pt
-            for pt in self._reach_points
-            if pt.subtype == access_type and pt.point_type == "access"
-        ]
+        # ensure points are hydrated, then read the matching accesses straight out of the index
+        self.reach_points
 
-        return pt_lst
+        return list(self._point_index.get(("access", access_type), []))
 
     def _set_putin_takeout(self, access, access_type):
         """
@@ -748,16 +804,21 @@ class Reach(object):
         access.point_type = "access"
         access.subtype = access_type
 
-        # add it to the reach point list
+        # add it to the reach point list and replace the index entry for this access type
         self._reach_points.append(access)
+        self._point_index[("access", access_type)] = [access]
+
+        # keep the dedicated putin and takeout attributes in sync
+        if access_type == "putin":
+            self._putin = access
+        else:
+            self._takeout = access
 
     @property
     def putin(self):
-        access_df = self._get_accesses_by_type("putin")
-        if len(access_df) > 0:
-            return access_df[0]
-        else:
-            return None
+        # ensure points are hydrated from the source json, then read the dedicated attribute
+        self.reach_points
+        return self._putin
 
     @putin.setter
     def putin(self, access):
@@ -765,11 +826,9 @@ class Reach(object):
 
     @property
     def takeout(self):
-        access_lst = self._get_accesses_by_type("takeout")
-        if len(access_lst) > 0:
-            return access_lst[0]
-        else:
-            return None
+        # ensure points are hydrated from the source json, then read the dedicated attribute
+        self.reach_points
+        return self._takeout
 
     @takeout.setter
     def takeout(self, access):
@@ -791,11 +850,12 @@ class Reach(object):
         access.point_type = "access"
         access.subtype = "intermediate"
         self._reach_points.append(access)
+        self._point_index.setdefault(("access", "intermediate"), []).append(access)
 
     @cached_property
     def geometry(self) -> Polygon:
         """Reach polyline geometry."""
-        geojson = self._main_json.get("info").get("geom")
+        geojson = self._info.get("geom")
         if geojson is None:
             geom = None
         else:
@@ -825,46 +885,18 @@ class Reach(object):
     @cached_property
     def attributes(self) -> dict:
         """Non-geometry properties for the reach."""
-        # list of properties to retrieve
-        prop_lst = [
-            "abstract",
-            "description",
-            "difficulty",
-            "difficulty",
-            "difficulty_filter",
-            "difficulty_maximum",
-            "difficulty_minimum",
-            "difficulty_outlier",
-            "gauge_id",
-            "gauge_max",
-            "gauge_metric",
-            "gauge_min",
-            "gauge_observation",
-            "gauge_source",
-            "gauge_stage",
-            "length",
-            "name",
-            "notes",
-            "reach_id",
-            "river_name",
-            "runnable",
-            "section_name",
-            "source",
-            "uid",
-            "url",
-        ]
+        return {k: getattr(self, k) for k in _REACH_ATTR_KEYS}
 
-        # create a dictionary of properties
-        properties = {k: getattr(self, k) for k in prop_lst}
-
-        return properties
-
-    @property
+    @cached_property
     def uid(self) -> str:
         """Universal unique identifier created by hashing the source and reach_id."""
-        comb_str = self.source + self.reach_id
-        hsh = md5(comb_str.encode()).hexdigest()
-        return hsh
+        # blake2b is faster than md5 on short strings and yields the same 128 bit identifier;
+        # source and reach_id do not change after construction, so caching is safe - feeding the
+        # hasher twice also skips the intermediate concatenated string
+        hsh = blake2b(digest_size=16)
+        hsh.update(self.source.encode())
+        hsh.update(self.reach_id.encode())
+        return hsh.hexdigest()
 
     @property
     def line_feature(self) -> Feature:
@@ -880,3 +912,31 @@ class Reach(object):
         """ArcGIS Python API point Feature object for the reach."""
         feat = Feature(geometry=self.centroid, attributes=self.attributes)
         return feat
+
+
+def reaches_to_dataframe(reaches: list[Reach]) -> pd.DataFrame:
+    """
+    Build a Spatially Enabled DataFrame from a collection of reaches.
+
+    Columns are assembled directly rather than stacking one row dictionary per reach,
+    so each attribute lands in a single contiguous column instead of making pandas
+    infer every dtype from scattered row objects.
+
+    :param reaches: Iterable of Reach objects.
+    :return: Spatially Enabled Pandas DataFrame with one row per reach, located by centroid.
+    """
+    reaches = list(reaches)
+
+    # nothing to assemble if no reaches provided
+    if len(reaches) == 0:
+        return pd.DataFrame()
+
+    # build columns directly - attributes is cached, so each reach only computes its values once
+    cols = {
+        key: [reach.attributes[key] for reach in reaches] for key in reaches[0].attributes
+    }
+    cols["SHAPE"] = [reach.centroid for reach in reaches]
+
+    df_reach = pd.DataFrame(cols)
+    df_reach.spatial.set_geometry("SHAPE")
+    return df_reach
@@ -1,14 +1,23 @@
 import re
 import logging
-from html.parser import HTMLParser
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
-from typing import Any, Tuple, Union
+from typing import Union
 
 from html2text import html2text
 
 from . import reference, aw
 from .logging_utils import configure_logging, format_pandas_for_logging
 
+# compiled once at import so batch ingestion does not pay per-call pattern cache lookups
+_TAG_RE = re.compile(r"<[^>]+>")
+_MULTI_SPACE = re.compile(r"\s{2,}")
+_JOIN_LINE = re.compile(r"(.)\n(.)")
+_DIFFICULTY_RE = re.compile(
+    r"^([I|IV|V|VI|5\.\d]{1,3}(?=-))?-?([I|IV|V|VI|5\.\d]{1,3}[+|-]?)\(?([I|IV|V|VI|5\.\d]{0,3}[+|-]?)"
+)
+
 __all__ = [
     "reference",
     "build_data_directory",
@@ -19,24 +28,7 @@ __all__ = [
 ]
 
 
-# helper for cleaning up HTML strings
-# From - https://stackoverflow.com/questions/753052/strip-html-from-strings-in-python
-class _MLStripper(HTMLParser):
-
-    def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs = True
-        self.fed = []
-
-    def handle_data(self, d):
-        self.fed.append(d)
-
-    def get_data(self) -> str:
-        return "".join(self.fed)
-
-
+@lru_cache(maxsize=8192)
 def strip_html_tags(html: str) -> str:
     """
     Remove HTML tags from a string.
@@ -47,9 +39,9 @@ def strip_html_tags(html: str) -> str:
     Returns:
         String with HTML tags removed.
     """
-    s = _MLStripper()
-    s.feed(html)
-    return s.get_data()
+    # a compiled substitution plus entity unescape covers what the HTMLParser-based stripper did
+    # without paying per-character Python dispatch and a parser allocation per call
+    return unescape(_TAG_RE.sub("", html))
 
 
 def build_data_directory(dir_path: Union[str, Path]) -> Path:
@@ -69,14 +61,10 @@ def build_data_directory(dir_path: Union[str, Path]) -> Path:
     if isinstance(dir_path, str):
         dir_path = Path(dir_path)
 
-    # if already exists, leave it alone
-    if dir_path.exists():
-        logging.debug(f'Directory already exists, so not recreating, "{dir_path}"')
-
-    # if does not exist, create it
-    else:
-        dir_path.mkdir(parents=True)
-        logging.info(f'Created directory at "{dir_path}"')
+    # one call covers both cases - no extra stat to check existence first, and no race between
+    # checking and creating
+    dir_path.mkdir(parents=True, exist_ok=True)
+    logging.debug(f'Ensured directory exists at "{dir_path}"')
 
     return dir_path
 
@@ -95,18 +83,15 @@ def build_data_resources(data_dir: Union[str, Path]) -> Path:
     if isinstance(data_dir, str):
         data_dir = Path(data_dir)
 
-    # build the parent data directory
-    build_data_directory(data_dir)
-
-    # build the four directories for the different types of data
-    build_data_directory(data_dir / "external")
-    build_data_directory(data_dir / "raw")
-    build_data_directory(data_dir / "interim")
-    build_data_directory(data_dir / "processed")
+    # build the four directories for the different types of data - creating the children with
+    # parents=True creates the data directory itself, so no separate parent call is needed
+    for child_dir in ("external", "raw", "interim", "processed"):
+        build_data_directory(data_dir / child_dir)
 
     return data_dir
 
 
+@lru_cache(maxsize=8192)
 def cleanup_string(input_string: str) -> str:
     """Helper function to clean up description strings."""
 
@@ -117,16 +102,17 @@ def cleanup_string(input_string: str) -> str:
     # convert to markdown first, so any reasonable formatting is retained
     cleanup = html2text(input_string)
 
-    # since people love to hit the space key multiple times in stupid places, get rid of multiple space, but leave
-    # newlines in there since they actually do contribute to formatting
-    cleanup = re.sub(r"\s{2,}", " ", cleanup)
+    # since people love to hit the space key multiple times in stupid places, get rid of multiple
+    # space - this collapses every multi-character whitespace run, so no consecutive newlines can
+    # survive it and a separate multi-newline rule would be dead code
+    cleanup = _MULTI_SPACE.sub(" ", cleanup)
 
-    # apparently some people think it is a good idea to hit return more than twice...account for this foolishness
-    cleanup = re.sub(r"\n{3,}", "\n\n", cleanup)
-    cleanup = re.sub(r"(.)\n(.)", r"\g<1> \g<2>", cleanup)
+    # join single newlines between text into one line
+    cleanup = _JOIN_LINE.sub(r"\g<1> \g<2>", cleanup)
 
-    # get rid of any trailing newlines at end of entire text block
-    cleanup = re.sub(r"\n+$", "", cleanup)
+    # get rid of any trailing newlines at end of entire text block - rstrip is a C loop with no
+    # regex machinery behind it
+    cleanup = cleanup.rstrip("\n")
 
     # correct any leftover standalone links
     cleanup = cleanup.replace("<", "[").replace(">", "]")
@@ -149,10 +135,7 @@ def remove_backslashes(input_str: str) -> str:
 def get_difficulty_parts(
     difficulty_combined: str,
 ) -> tuple[str | None, str | None, str | None]:
-    match = re.match(
-        r"^([I|IV|V|VI|5\.\d]{1,3}(?=-))?-?([I|IV|V|VI|5\.\d]{1,3}[+|-]?)\(?([I|IV|V|VI|5\.\d]{0,3}[+|-]?)",
-        difficulty_combined,
-    )
+    match = _DIFFICULTY_RE.match(difficulty_combined)
 
     # helper function to get difficulty parts
     get_if_match = lambda match_string: (
@@ -1,26 +1,100 @@
 """Tools and utilities unique to working with American Whitewater data."""
 
-import re
-from typing import Any, Union
-
-__all__ = ["get_stage", "get_runnable"]
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Optional, Union
+
+import numpy as np
+
+__all__ = ["CompiledGauge", "compile_gauge", "get_stage", "get_stage_array", "get_runnable"]
+
+# ordered stage labels for every combination of metric count and range bias; the label at index
+# i describes observations falling in the half-open interval (metric[i], metric[i + 1]]
+_STAGE_LABELS: dict[tuple[int, str], tuple[str, ...]] = {}
+
+
+def _register_stage_labels(metric_count: int, biases: tuple[str, ...], labels: tuple[str, ...]) -> None:
+    """Helper to register one label stratification for one or more range biases."""
+    # intern the labels so every classification result across reaches shares one string object,
+    # letting downstream equality checks and pandas groupbys hit the pointer-identity shortcut
+    labels = tuple(sys.intern(label) for label in labels)
+    for bias in biases:
+        _STAGE_LABELS[(metric_count, bias)] = labels
+
+
+_ALL_BIASES = ("low", "balanced", "high")
+
+# three metrics bifurcates runnable into lower and higher
+_register_stage_labels(3, _ALL_BIASES, ("lower runnable", "higher runnable"))
+
+# four metrics stratifies runnable into low, medium and high
+_register_stage_labels(4, _ALL_BIASES, ("low", "medium", "high"))
+
+# five metrics stratifies according to where the range detail is concentrated
+_register_stage_labels(5, ("low",), ("very low", "medium low", "medium", "high"))
+_register_stage_labels(5, ("high",), ("low", "medium", "medium high", "very high"))
+
+# six metrics, with even detail, is straightforward
+_register_stage_labels(6, _ALL_BIASES, ("low", "medium low", "medium", "high medium", "high"))
+
+# seven metrics stratifies according to bias
+_register_stage_labels(7, ("low",), ("very low", "low", "medium low", "medium", "high medium", "high"))
+_register_stage_labels(7, ("high",), ("low", "medium low", "high medium", "medium", "high medium", "high"))
+
+# eight metrics, an even number, is easy to stratify
+_register_stage_labels(
+    8, _ALL_BIASES, ("very low", "low", "medium low", "medium", "medium high", "high", "very high")
+)
+
+# nine metrics stratifies according to bias
+_register_stage_labels(
+    9,
+    ("low",),
+    ("extremely low", "very low", "low", "medium low", "medium", "medium high", "high", "very high"),
+)
+_register_stage_labels(
+    9,
+    ("high",),
+    ("very low", "low", "medium low", "medium", "medium high", "high", "very high", "extremely high"),
+)
+
+# ten metrics, again even, is easy
+_register_stage_labels(
+    10,
+    _ALL_BIASES,
+    (
+        "extremely low",
+        "very low",
+        "low",
+        "medium low",
+        "medium",
+        "medium high",
+        "high",
+        "very high",
+        "extremely high",
+    ),
+)
+
+
+# nesting of the gauge ranges within the full AW JSON payload - get_gauge_ranges walks down this
+# path from whatever level the caller handed in
+_RANGES_PATH = (
+    "CContainerViewJSON_view",
+    "CRiverMainGadgetJSON_main",
+    "guagesummary",
+    "ranges",
+)
 
 
 def get_gauge_ranges(gauge_ranges: Union[dict, list[dict]]) -> list[dict]:
     """Based on the input JSON, make sure have the correct information from the AW JSON dictionary."""
-    # bore down into AW JSON if necessary
-    if "CContainerViewJSON_view" in gauge_ranges.keys():
-        gauge_ranges = gauge_ranges["CContainerViewJSON_view"][
-            "CRiverMainGadgetJSON_main"
-        ]["guagesummary"].get("ranges")
-    elif "CRiverMainGadgetJSON_main" in gauge_ranges.keys():
-        gauge_ranges = gauge_ranges["CRiverMainGadgetJSON_main"]["guagesummary"].get(
-            "ranges"
-        )
-    elif "guagesummary" in gauge_ranges.keys():
-        gauge_ranges = gauge_ranges["guagesummary"].get("ranges")
-    elif "ranges" in gauge_ranges.keys():
-        gauge_ranges = gauge_ranges["ranges"]
+    # bore down into AW JSON if necessary, stepping through whichever wrapper keys are present
+    for key in _RANGES_PATH:
+        if isinstance(gauge_ranges, dict) and key in gauge_ranges:
+            gauge_ranges = gauge_ranges[key]
 
     # check if some of the necessary keys are in the first object if anything is available to work with
     if len(gauge_ranges) and gauge_ranges[0].get("range_min") is None:
@@ -33,18 +107,24 @@ def get_gauge_ranges(gauge_ranges: Union[dict, list[dict]]) -> list[dict]:
 
 def get_gauge_value_list(gauge_ranges: Union[dict, list[dict]]) -> list[list]:
     """Helper to get non-repeating list of gauge key and values."""
-    # create a set to populate
+    # create a list to populate - order matters for the later sort, so this is not a set
     val_lst = list()
 
+    # values already collected, so the dedup check is a set probe rather than a list rebuild
+    seen = set()
+
     # iterate the list of gauge ranges and add all
     for rng in gauge_ranges:
 
+        # bind the keys once per range so each is a single dict probe
+        rng_min_key, rng_max_key = rng.get("range_min"), rng.get("range_max")
+
         # TODO: Sort out what L and H prefixes mean, but util then, remove them
-        if rng.get("range_min").startswith("R") or rng.get("range_max").startswith("R"):
+        if rng_min_key[:1] == "R" or rng_max_key[:1] == "R":
 
             # get tuples of the index and values for the gauge ranges
-            min_lst = [rng.get("range_min"), rng.get("min")]
-            max_lst = [rng.get("range_max"), rng.get("max")]
+            min_lst = [rng_min_key, rng.get("min")]
+            max_lst = [rng_max_key, rng.get("max")]
 
             # for each of the metrics retrieved
             for metric in (min_lst, max_lst):
@@ -56,26 +136,40 @@ def get_gauge_value_list(gauge_ranges: Union[dict, list[dict]]) -> list[list]:
                     metric[1] = float(metric[1])
 
                     # if the value is not already in the list of values
-                    if metric[1] not in [val[1] for val in val_lst]:
+                    if metric[1] not in seen:
 
-                        # add the metric to the set
+                        # add the metric to the list
+                        seen.add(metric[1])
                         val_lst.append(metric)
 
-    # sort the values
-    val_lst = sorted(val_lst)
+    # sort in place on the numeric value - this is the order the bisect consumers need, and it
+    # skips comparing the key strings the default list comparison would start with
+    val_lst.sort(key=itemgetter(1))
 
     return val_lst
 
 
 def get_range_bias(gauge_keys: list[str]):
     """Helper to determine if ranges have more detail higher or lower in the scale, or are evenly balanced."""
+    # bias never changes for a given gauge definition, so answer repeat key sets from the cache
+    return _get_range_bias(tuple(gauge_keys))
+
+
+@lru_cache(maxsize=512)
+def _get_range_bias(gauge_keys: tuple) -> str:
+    """Cached worker for get_range_bias, keyed on the hashable tuple of gauge keys."""
     # get the index values without the prefix as numbers for comparison if not already integers
     if isinstance(gauge_keys[0], str):
         gauge_keys = [int(key.lstrip("R")) for key in gauge_keys]
 
-    # determine if the bias is low, balanced or high based on index range from 0-9
-    low_len = len([v for v in gauge_keys if v <= 4])
-    high_len = len([v for v in gauge_keys if v >= 5])
+    # determine if the bias is low, balanced or high based on index range from 0-9 - count both
+    # sides in a single pass instead of allocating two filtered lists
+    low_len = high_len = 0
+    for v in gauge_keys:
+        if v <= 4:
+            low_len += 1
+        else:
+            high_len += 1
 
     # determine if the range values are weighted higher or lower
     if low_len > high_len:
@@ -136,6 +230,77 @@ def get_runnable(
     return runnable
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledGauge:
+    """
+    Gauge ranges distilled once into sorted breakpoints, range bias and stage labels, so
+    classifying each observation is a single binary search with no JSON traversal.
+    """
+
+    breakpoints: tuple[float, ...]
+    bias: str
+    labels: Optional[tuple[str, ...]]
+
+    def stage(self, gauge_observation: Union[float, int]) -> str:
+        """Get the human-readable stage description for a single gauge observation."""
+        # if no observation provided, nothing to return
+        if gauge_observation is None:
+            return "no gauge reading"
+
+        breakpoints = self.breakpoints
+
+        # readings above the highest metric are always too high
+        if gauge_observation > breakpoints[-1]:
+            return "too high"
+
+        # readings below the lowest metric are too low, except the single-metric high-bias
+        # case, which treats anything below its one value as runnable
+        if gauge_observation < breakpoints[0]:
+            if len(breakpoints) == 1 and self.bias == "high":
+                return "runnable"
+            return "too low"
+
+        # if between only two values, is runnable
+        if len(breakpoints) == 2 and breakpoints[0] < gauge_observation < breakpoints[1]:
+            return "runnable"
+
+        # locate the half-open bucket (breakpoint[i], breakpoint[i + 1]] with one binary search
+        idx = bisect_left(breakpoints, gauge_observation) - 1
+
+        # no label when the stratification is undefined or the observation sits on the lowest metric
+        if self.labels is None or idx < 0 or idx >= len(self.labels):
+            return None
+
+        return self.labels[idx]
+
+
+def compile_gauge(gauge_ranges: Union[dict, list[dict]]) -> CompiledGauge:
+    """
+    Compile gauge ranges from the AW JSON dictionary into a CompiledGauge, paying the unwrap,
+    dedup, sort and bias costs exactly once for any number of observations.
+
+    Args:
+        gauge_ranges: Gauge ranges from the AW JSON dictionary, at any level of nesting.
+
+    Returns:
+        CompiledGauge ready for repeated stage classification.
+    """
+    # ensure working with correct gauge ranges
+    gauge_ranges = get_gauge_ranges(gauge_ranges)
+
+    # get the ranges and metric indexes into non-repeating sorted list
+    range_key_lst, metric_lst = zip(*get_gauge_value_list(gauge_ranges))
+
+    # get the range bias and label stratification for this metric count
+    range_bias = get_range_bias(range_key_lst)
+
+    return CompiledGauge(
+        breakpoints=tuple(metric_lst),
+        bias=range_bias,
+        labels=_STAGE_LABELS.get((len(metric_lst), range_bias)),
+    )
+
+
 def get_stage(
     gauge_ranges: Union[dict, list[dict]], gauge_observation: Union[float, int]
 ) -> str:
@@ -154,198 +319,62 @@ def get_stage(
     if gauge_observation is None:
         return "no gauge reading"
 
+    # compile the ranges and classify - callers with many observations against one gauge should
+    # hold the CompiledGauge from compile_gauge and call stage directly
+    return compile_gauge(gauge_ranges).stage(gauge_observation)
+
+
+def get_stage_array(
+    gauge_ranges: Union[dict, list[dict]], gauge_observations: Union[list, np.ndarray]
+) -> np.ndarray:
+    """
+    Classify many gauge observations against one set of gauge ranges in a single vectorized pass.
+
+    Args:
+        gauge_ranges: Gauge ranges from the AW JSON dictionary, at any level of nesting.
+        gauge_observations: Observed gauge values to classify.
+
+    Returns:
+        Object array of stage descriptions matching get_stage for every observation.
+    """
     # ensure working with correct gauge ranges
     gauge_ranges = get_gauge_ranges(gauge_ranges)
 
     # get the ranges and metric indexes into non-repeating sorted list
     range_key_lst, metric_lst = zip(*get_gauge_value_list(gauge_ranges))
 
-    # get range bias
+    # get range bias and the label stratification for this metric count
     range_bias = get_range_bias(range_key_lst)
+    labels = _STAGE_LABELS.get((len(metric_lst), range_bias))
+
+    # contiguous arrays for the breakpoints and observations
+    metrics = np.asarray(metric_lst, dtype=np.float64)
+    obs = np.asarray(gauge_observations, dtype=np.float64)
+
+    # object arrays from np.empty start out None, matching get_stage fall-through results
+    out = np.empty(obs.shape, dtype=object)
 
     # if high bias with only one value or between two values, is runnable
-    if (
-        (
-            (range_bias == "high")
-            and (len(metric_lst) == 1)
-            and (gauge_observation < metric_lst[0])
-        )
-        # or (
-        #     (range_bias == "low")
-        #     and (len(metric_lst) == 1)
-        #     and (gauge_observation > metric_lst[0])
-        # )
-        or (
-            (len(metric_lst) == 2)
-            and (metric_lst[0] < gauge_observation < metric_lst[1])
-        )
-    ):
-        return "runnable"
-
-    # if below the lowest value, is too low
-    if gauge_observation < metric_lst[0]:
-        return "too low"
-
-    # if above the highest value, is too high
-    if gauge_observation > metric_lst[-1]:
-        return "too high"
-
-    # if three metrics, bifurcates runnable into lower and higher
-    if len(metric_lst) == 3:
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "lower runnable"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "higher runnable"
-
-    # if four metrics runnable becomes low, medium and high
-    if len(metric_lst) == 4:
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "medium"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "high"
-
-    # if five metrics with more divisions below the middle of the ranges, stratify into two lows, medium and high
-    if (len(metric_lst) == 5) and (range_bias == "low"):
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "very low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "medium low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "high"
-
-    # if five metrics with more divisions above the middle of the ranges, stratify accordingly
-    if (len(metric_lst) == 5) and (range_bias == "high"):
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "medium"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium high"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "very high"
-
-    # if six, stratify
-    if len(metric_lst) == 6:
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "medium low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "high medium"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "high"
-
-    # if seven with low bias, stratify accordingly
-    if (len(metric_lst) == 7) and (range_bias == "low"):
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "very low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium low"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "high medium"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "high"
-
-    # if seven and high bias, stratify accordingly
-    if (len(metric_lst) == 7) and (range_bias == "high"):
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "medium low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "high medium"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "high medium"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "high"
-
-    # if eight, even numbers easy to stratify
-    if len(metric_lst) == 8:
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "very low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium low"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "medium high"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "high"
-        if metric_lst[6] < gauge_observation <= metric_lst[7]:
-            return "very high"
-
-    # at nine, stratify based on low bias
-    if (len(metric_lst) == 9) and range_bias == "low":
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "extremely low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "very low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "low"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium low"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "medium"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "medium high"
-        if metric_lst[6] < gauge_observation <= metric_lst[7]:
-            return "high"
-        if metric_lst[7] < gauge_observation <= metric_lst[8]:
-            return "very high"
-
-    # again for nine, stratify accroding to high bias
-    if len(metric_lst) == 9 and range_bias == "high":
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "very low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "medium low"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "medium high"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "high"
-        if metric_lst[6] < gauge_observation <= metric_lst[7]:
-            return "very high"
-        if metric_lst[7] < gauge_observation <= metric_lst[8]:
-            return "extremely high"
-
-    # even number ten is easy
-    if len(metric_lst) == 10:
-        if metric_lst[0] < gauge_observation <= metric_lst[1]:
-            return "extremely low"
-        if metric_lst[1] < gauge_observation <= metric_lst[2]:
-            return "very low"
-        if metric_lst[2] < gauge_observation <= metric_lst[3]:
-            return "low"
-        if metric_lst[3] < gauge_observation <= metric_lst[4]:
-            return "medium low"
-        if metric_lst[4] < gauge_observation <= metric_lst[5]:
-            return "medium"
-        if metric_lst[5] < gauge_observation <= metric_lst[6]:
-            return "medium high"
-        if metric_lst[6] < gauge_observation <= metric_lst[7]:
-            return "high"
-        if metric_lst[7] < gauge_observation <= metric_lst[8]:
-            return "very high"
-        if metric_lst[8] < gauge_observation <= metric_lst[9]:
-            return "extremely high"
+    if range_bias == "high" and metrics.size == 1:
+        runnable = obs < metrics[0]
+    elif metrics.size == 2:
+        runnable = (metrics[0] < obs) & (obs < metrics[1])
+    else:
+        runnable = np.zeros(obs.shape, dtype=bool)
+    out[runnable] = "runnable"
+
+    # below the lowest value is too low, above the highest is too high
+    rest = ~runnable
+    out[rest & (obs < metrics[0])] = "too low"
+    out[rest & (obs > metrics[-1])] = "too high"
+
+    # locate every interior bucket with one binary search over the breakpoints
+    if labels is not None:
+        idx = np.searchsorted(metrics, obs, side="left") - 1
+        interior = rest & (obs > metrics[0]) & (obs <= metrics[-1]) & (idx < len(labels))
+        out[interior] = np.asarray(labels, dtype=object)[idx[interior]]
+
+    return out
 
 
 def get_key_from_block(json_block: dict, key: str) -> Any:
@@ -362,12 +391,9 @@ def get_key_from_block(json_block: dict, key: str) -> Any:
         # clean up the text garbage...because there is a lot of it
         ret_val = cleanup_string(ret_val)
 
-        # now, ensure something is still there...not kidding, this frequently is the case...it is all gone
-        if (
-            (len(ret_val) == 0)
-            or (re.match(r"^([\r\n\t])+$", ret_val))
-            or (ret_val == "N/A")
-        ):
+        # now, ensure something is still there...not kidding, this frequently is the case...it is
+        # all gone - stripping control characters covers the whitespace-only case with no regex
+        if not ret_val.strip("\r\n\t") or ret_val == "N/A":
             ret_val = None
 
     return ret_val
@@ -1,10 +1,64 @@
-from typing import Union
+import gzip
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Union
 
 import requests
 
+# orjson decodes the large AW payloads several times faster than the stdlib json module, but is
+# optional - fall back to response.json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def download_raw_json_from_aw(aw_reach_id: Union[int, str]) -> dict:
-    """Download the raw JSON data from American Whitewater for a given reach ID."""
+# header dictionary with user agent for cloudflare
+_headers = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/135.0.1.0.dev0 Safari/537.36 "
+    "Edg/135.0.1.0.dev0"
+}
+
+# module level session so every request reuses pooled keep-alive connections instead of paying a
+# fresh TCP and TLS handshake, with retries and backoff handled by the adapter
+_session = requests.Session()
+_session.headers.update(_headers)
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    ),
+)
+
+
+@lru_cache(maxsize=10_000)
+def download_raw_json_from_aw(
+    aw_reach_id: Union[int, str], cache_dir: Optional[Union[str, Path]] = None
+) -> dict:
+    """
+    Download the raw JSON data from American Whitewater for a given reach ID.
+
+    Args:
+        aw_reach_id: American Whitewater reach ID.
+        cache_dir: Optional directory for a compressed disk cache. When provided, payloads are
+            read from and saved to ``aw_<reach_id>.json.gz`` files, skipping the network on
+            repeat runs.
+    """
+    # if a disk cache was provided and holds this reach, skip the network entirely
+    if cache_dir is not None:
+        cache_pth = Path(cache_dir) / f"aw_{int(aw_reach_id):08d}.json.gz"
+        if cache_pth.exists():
+            data = gzip.decompress(cache_pth.read_bytes())
+            return orjson.loads(data) if orjson is not None else json.loads(data)
 
     # construct the URL to download reach data
     url = f"https://www.americanwhitewater.org/content/River/detail/id/{aw_reach_id}/.json"
@@ -13,28 +67,105 @@ def download_raw_json_from_aw(aw_reach_id: Union[int, str]) -> dict:
     attempts = 0
     max_attempts = 30
 
-    # header dictionary with user agent for cloudflare
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/135.0.1.0.dev0 Safari/537.36 "
-        "Edg/135.0.1.0.dev0"
-    }
-
     # loop to retry the request if it fails...less likely now they are using cloudflare
+    out_json = None
     while attempts < max_attempts:
 
-        # make the request to the url
-        resp = requests.get(url, headers=headers)
+        # make the request to the url, reusing a pooled connection from the shared session
+        resp = _session.get(url, timeout=30)
 
         # check the status code of the response
         if resp.status_code == 200 and len(resp.content):
-            out_json = resp.json()
+            # parse the raw bytes directly so no intermediate text decode is performed
+            out_json = orjson.loads(resp.content) if orjson is not None else resp.json()
             break
-        else:
-            attempts = attempts + 1
 
-    if attempts >= max_attempts:
+        # client errors other than rate limiting will never succeed on retry, so fail fast
+        if 400 <= resp.status_code < 500 and resp.status_code != 429:
+            raise Exception(
+                f"Cannot download data for reach_id={aw_reach_id} from AW "
+                f"(HTTP {resp.status_code})"
+            )
+
+        # back off exponentially with jitter before retrying so rate limiting is not escalated
+        attempts = attempts + 1
+        time.sleep(min(30, 2**attempts) + random.random())
+
+    if out_json is None:
         raise Exception(f"Cannot download data for reach_id={aw_reach_id} from AW")
 
-    return out_json
\ No newline at end of file
+    # save to the disk cache so subsequent runs do not re-fetch
+    if cache_dir is not None:
+        cache_pth.parent.mkdir(parents=True, exist_ok=True)
+        payload = orjson.dumps(out_json) if orjson is not None else json.dumps(out_json).encode()
+        cache_pth.write_bytes(gzip.compress(payload))
+
+    return out_json
+
+
+def download_aw_ranges_only(aw_reach_id: Union[int, str]) -> list[dict]:
+    """
+    Download only the gauge ranges for a reach, streaming past the rest of the document.
+
+    Reach detail pages routinely exceed 100 KB, but callers feeding ``get_stage`` and
+    ``get_runnable`` only need the ``guagesummary.ranges`` block. Streaming the response
+    through ijson pulls out just that list without materializing the full JSON tree.
+
+    Args:
+        aw_reach_id: American Whitewater reach ID.
+
+    Returns:
+        List of gauge range dictionaries for the reach.
+    """
+    # ijson is optional - without it, fall back to downloading and unwrapping the full document
+    try:
+        import ijson
+    except ImportError:
+        from .aw import get_gauge_ranges
+
+        return get_gauge_ranges(download_raw_json_from_aw(aw_reach_id))
+
+    # construct the URL to download reach data
+    url = f"https://www.americanwhitewater.org/content/River/detail/id/{aw_reach_id}/.json"
+
+    # stream the response so only the ranges block is parsed into Python objects
+    resp = _session.get(url, stream=True, timeout=30)
+    try:
+        if resp.status_code != 200:
+            raise Exception(
+                f"Cannot download data for reach_id={aw_reach_id} from AW "
+                f"(HTTP {resp.status_code})"
+            )
+
+        # requests leaves the raw stream compressed when handed out directly, so tell urllib3 to
+        # gunzip on read - otherwise ijson would be parsing gzip bytes
+        resp.raw.decode_content = True
+
+        return list(
+            ijson.items(
+                resp.raw,
+                "CContainerViewJSON_view.CRiverMainGadgetJSON_main.guagesummary.ranges.item",
+            )
+        )
+    finally:
+        resp.close()
+
+
+def download_raw_json_from_aw_many(
+    aw_reach_ids: Iterable[Union[int, str]], max_workers: int = 16
+) -> list[dict]:
+    """
+    Download raw JSON for many reaches concurrently.
+
+    Requests are I/O bound, so a small thread pool over the shared pooled session collapses the
+    stacked round-trip latency of a serial loop.
+
+    Args:
+        aw_reach_ids: American Whitewater reach IDs to download.
+        max_workers: Maximum concurrent downloads.
+
+    Returns:
+        List of raw JSON dictionaries in the same order as the input reach IDs.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(download_raw_json_from_aw, aw_reach_ids))
@@ -6,6 +6,13 @@ import json
 from pathlib import Path
 
 import pytest
+
+# orjson parses the reach fixtures several times faster than the stdlib json module, but is
+# optional - fall back to json.loads when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from arcgis.features import Feature
 from arcgis.geometry import Polygon, Polyline
 
@@ -18,8 +25,9 @@ def tilton_dict():
         Path(__file__).parent.parent / "data/raw/american_whitewater/aw_00003411.json"
     )
 
-    with open(json_pth, "r") as f:
-        reach_dict = json.load(f)
+    # parse the raw bytes directly so no intermediate text decode is performed
+    raw = json_pth.read_bytes()
+    reach_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     return reach_dict
 
@@ -39,6 +47,19 @@ def test_get_gauge_stage_tilton_too_high(tilton_dict):
     assert stage == "too high"
 
 
+def test_get_stage_array_tilton(tilton_dict):
+    stages = reach_tools.utils.aw.get_stage_array(tilton_dict, [360, 1680, 8000])
+    assert list(stages) == ["too low", "medium", "too high"]
+
+
+def test_compiled_gauge_matches_get_stage_tilton(tilton_dict):
+    compiled = reach_tools.utils.aw.compile_gauge(tilton_dict)
+    for observation in (360, 1000, 1680, 3000, 8000):
+        assert compiled.stage(observation) == reach_tools.utils.aw.get_stage(
+            tilton_dict, observation
+        )
+
+
 def test_get_runnable_tilton_true(tilton_dict):
     runnable = reach_tools.utils.aw.get_runnable(tilton_dict, 1000)
     assert runnable is True